@@ -0,0 +1,264 @@
+#!python3
+"""Load-test the backend `Plugin` RPCs without a Steam Deck.
+
+A local stand-in for the `decky` module (see `decky.pyi`) is installed before
+`main` is imported, so the real `Plugin` coroutines run against a temporary
+presets.conf. Many simulated clients then replay panel-like traffic (reads,
+preset switching, apply bursts, deletes) concurrently, and per-method
+throughput, tail latency and event-loop lag are reported.
+
+Usage:
+    python3 _decky_load_harness.py --clients 32 --duration 5
+"""
+import argparse
+import asyncio
+import logging
+import math
+import random
+import shutil
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CLIENTS = 16
+DEFAULT_DURATION = 3.0
+DEFAULT_LAG_INTERVAL = 0.005
+DEFAULT_PRESETS = (1, 2, 3, 4)
+
+logger = logging.getLogger("decky-loadtest")
+
+
+def create_fake_decky(root: Path) -> types.ModuleType:
+    """Build a module mimicking the decky loader API, rooted at `root`."""
+    home = root / "home"
+    decky_home = home / "homebrew"
+    plugin_name = "decky-mangohud-time"
+    settings_dir = decky_home / "settings" / plugin_name
+    runtime_dir = decky_home / "data" / plugin_name
+    log_dir = decky_home / "logs" / plugin_name
+    for d in (settings_dir, runtime_dir, log_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    fake = types.ModuleType("decky")
+    fake.HOME = str(home)
+    fake.USER = "deck"
+    fake.DECKY_VERSION = "v0.0.0-loadtest"
+    fake.DECKY_USER = "deck"
+    fake.DECKY_USER_HOME = str(home)
+    fake.DECKY_HOME = str(decky_home)
+    fake.DECKY_PLUGIN_SETTINGS_DIR = str(settings_dir)
+    fake.DECKY_PLUGIN_RUNTIME_DIR = str(runtime_dir)
+    fake.DECKY_PLUGIN_LOG_DIR = str(log_dir)
+    fake.DECKY_PLUGIN_DIR = str(root)
+    fake.DECKY_PLUGIN_NAME = plugin_name
+    fake.DECKY_PLUGIN_VERSION = "0.0.0"
+    fake.DECKY_PLUGIN_AUTHOR = "loadtest"
+    fake.DECKY_PLUGIN_LOG = str(log_dir / "plugin.log")
+
+    fake.logger = logger
+    fake.emitted = []
+
+    async def emit(event: str, *args: Any) -> None:
+        fake.emitted.append((event, args))
+
+    def migrate_any(target_dir: str, *files_or_directories: str) -> dict[str, str]:
+        return {}
+
+    fake.emit = emit
+    fake.migrate_any = migrate_any
+    fake.migrate_settings = lambda *f: migrate_any(fake.DECKY_PLUGIN_SETTINGS_DIR, *f)
+    fake.migrate_runtime = lambda *f: migrate_any(fake.DECKY_PLUGIN_RUNTIME_DIR, *f)
+    fake.migrate_logs = lambda *f: migrate_any(fake.DECKY_PLUGIN_LOG_DIR, *f)
+    return fake
+
+
+def load_plugin_module(fake_decky: types.ModuleType, config_path: Path) -> types.ModuleType:
+    """Import `main` with `fake_decky` in place and point its editor at `config_path`."""
+    sys.modules["decky"] = fake_decky
+    import main
+
+    main.decky = fake_decky
+    main.mangohud_editor = main.MangoHudConfigEditor(path=config_path)
+    return main
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+        self.first_exceptions: dict[str, BaseException] = {}
+        self.loop_lag: list[float] = []
+
+    def record(self, method: str, seconds: float) -> None:
+        self.latencies.setdefault(method, []).append(seconds)
+
+    def record_error(self, method: str, exc: BaseException) -> None:
+        self.errors[method] = self.errors.get(method, 0) + 1
+        if method not in self.first_exceptions:
+            self.first_exceptions[method] = exc
+            logger.exception("%s failed", method, exc_info=exc)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list, 0.0 if it is empty."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(rank, 1)) - 1]
+
+
+async def _run(stats: Stats, plugin: Any, issued: float, method: str, *args: Any) -> Any:
+    try:
+        return await getattr(plugin, method)(*args)
+    except Exception as e:
+        stats.record_error(method, e)
+    finally:
+        stats.record(method, time.perf_counter() - issued)
+
+
+def _dispatch(stats: Stats, plugin: Any, method: str, *args: Any) -> asyncio.Task:
+    """Issue an RPC as its own task, like the loader does.
+
+    Latency is measured from issue time, so time spent queued behind other
+    clients' calls on the event loop is included.
+    """
+    return asyncio.create_task(_run(stats, plugin, time.perf_counter(), method, *args))
+
+
+def _apply(stats: Stats, plugin: Any, rng: random.Random, preset: int) -> asyncio.Task:
+    return _dispatch(
+        stats, plugin, "mangohud_upsert_time_preset",
+        preset,
+        round(rng.uniform(0.2, 1.0), 2),
+        round(rng.uniform(0.0, 0.8), 2),
+        rng.randint(-20, 20),
+        rng.randint(0, 400),
+        rng.choice(["%H:%M", "%H:%M:%S", "%I:%M %p"]),
+        rng.choice(["top-left", "top-right", "bottom-left", "bottom-right"]),
+    )
+
+
+async def _client(
+    stats: Stats,
+    plugin: Any,
+    seed: int,
+    deadline: float,
+    presets: tuple[int, ...],
+) -> None:
+    """Replay what the panel does: refresh, switch preset, apply (often in bursts), delete."""
+    rng = random.Random(seed)
+    preset = rng.choice(presets)
+    while time.perf_counter() < deadline:
+        action = rng.random()
+        if action < 0.4:
+            # Panel refresh
+            await _dispatch(stats, plugin, "mangohud_get_current_preset_data", preset)
+            await _dispatch(stats, plugin, "mangohud_preset_is_empty", preset)
+            await _dispatch(stats, plugin, "mangohud_preset_non_plugin_keys_inside", preset)
+        elif action < 0.6:
+            # Preset switch, followed by a refresh of the new preset
+            preset = rng.choice(presets)
+            await _dispatch(stats, plugin, "mangohud_get_default_preset_key_values")
+            await _dispatch(stats, plugin, "mangohud_get_current_preset_data", preset)
+        elif action < 0.9:
+            # Apply burst, e.g. dragging a slider sends these without waiting
+            await asyncio.gather(*(
+                _apply(stats, plugin, rng, preset) for _ in range(rng.randint(1, 8))
+            ))
+        else:
+            await _dispatch(stats, plugin, "mangohud_delete_preset", preset)
+        await asyncio.sleep(0)
+
+
+async def _monitor_loop_lag(stats: Stats, interval: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        stats.loop_lag.append(max(0.0, loop.time() - expected))
+
+
+async def run_load_test(
+    plugin: Any,
+    clients: int = DEFAULT_CLIENTS,
+    duration: float = DEFAULT_DURATION,
+    presets: tuple[int, ...] = DEFAULT_PRESETS,
+    lag_interval: float = DEFAULT_LAG_INTERVAL,
+    seed: int = 0,
+) -> tuple[Stats, float]:
+    """Run `clients` simulated panels against `plugin` for `duration` seconds."""
+    stats = Stats()
+    stop = asyncio.Event()
+    await plugin._main()
+    monitor = asyncio.create_task(_monitor_loop_lag(stats, lag_interval, stop))
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(
+        _client(stats, plugin, seed + i, deadline, presets) for i in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    await plugin._unload()
+    return stats, elapsed
+
+
+def format_report(stats: Stats, elapsed: float) -> str:
+    lines = [
+        f"{'method':<42} {'calls':>7} {'err':>5} {'ops/s':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+    ]
+    for method in sorted(stats.latencies):
+        values = sorted(stats.latencies[method])
+        lines.append(
+            f"{method:<42} {len(values):>7} {stats.errors.get(method, 0):>5} "
+            f"{len(values) / elapsed:>9.1f} "
+            f"{_percentile(values, 50) * 1000:>8.3f} "
+            f"{_percentile(values, 95) * 1000:>8.3f} "
+            f"{_percentile(values, 99) * 1000:>8.3f} "
+            f"{values[-1] * 1000:>8.3f}"
+        )
+    lag = sorted(stats.loop_lag)
+    lines.append(
+        f"event-loop lag: samples={len(lag)} "
+        f"p50={_percentile(lag, 50) * 1000:.3f}ms "
+        f"p99={_percentile(lag, 99) * 1000:.3f}ms "
+        f"max={(lag[-1] if lag else 0.0) * 1000:.3f}ms"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds")
+    parser.add_argument("--presets", type=int, nargs="+", default=list(DEFAULT_PRESETS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    root = Path(tempfile.mkdtemp(prefix="decky-loadtest-"))
+    try:
+        fake_decky = create_fake_decky(root)
+        plugin_module = load_plugin_module(
+            fake_decky, Path(fake_decky.DECKY_USER_HOME) / ".config" / "MangoHud" / "presets.conf"
+        )
+        stats, elapsed = asyncio.run(run_load_test(
+            plugin_module.Plugin(),
+            clients=args.clients,
+            duration=args.duration,
+            presets=tuple(args.presets),
+            seed=args.seed,
+        ))
+        print(f"{args.clients} clients, {elapsed:.2f}s, {len(fake_decky.emitted)} events emitted")
+        print(format_report(stats, elapsed))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import asyncio
 from pathlib import Path
 from configparser import ConfigParser
 import shutil
+import time
 
 MANGOHUD_CONFIG_PATH = Path.home() / ".config" / "MangoHud" / "presets.conf"
 
@@ -35,10 +36,19 @@ MANGOHUD_DEFAULT_PRESET_FLAGS = [
     "time_no_label",
 ]
 
+# Directory mtimes are only as fine as the kernel's coarse clock, so a "file
+# absent" entry is only cached once its parent directory has been unchanged
+# for this long (same idea as git's racy-index check).
+_ABSENT_CACHE_RACY_WINDOW_NS = 2_000_000_000
+_NOT_CACHED = object()
+
 class MangoHudConfigEditor:
     def __init__(self, path: Path = MANGOHUD_CONFIG_PATH):
         self.path = Path(path).expanduser()
         self._create_config_parser()
+        # Parent directory mtime (or None if it is missing) observed when the
+        # config was last found absent
+        self._absent_parent_mtime_ns = _NOT_CACHED
 
     def _create_config_parser(self) -> None:
         self.config_parser = ConfigParser(
@@ -65,6 +75,57 @@ class MangoHudConfigEditor:
         with self.path.open("r", encoding="utf-8") as f:
             self.config_parser.read_file(f)
 
+    def _parent_mtime_ns(self) -> int | None:
+        try:
+            return os.stat(self.path.parent).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _config_known_absent(self) -> bool:
+        if self._absent_parent_mtime_ns is _NOT_CACHED:
+            return False
+        if self._parent_mtime_ns() == self._absent_parent_mtime_ns:
+            return True
+        self._absent_parent_mtime_ns = _NOT_CACHED
+        return False
+
+    def _confirm_config_absent(self) -> bool:
+        """Return True if the config is still absent, caching that when it is safe to."""
+        parent_mtime_ns = self._parent_mtime_ns()
+        # Re-check after sampling the parent, so a file created in between is
+        # not missed. lstat also finds dangling symlinks, whose target can
+        # appear without the parent dir changing, so those are never cached.
+        try:
+            os.lstat(self.path)
+        except FileNotFoundError:
+            pass
+        else:
+            return not self.path.exists()
+        if parent_mtime_ns is None or time.time_ns() - parent_mtime_ns > _ABSENT_CACHE_RACY_WINDOW_NS:
+            self._absent_parent_mtime_ns = parent_mtime_ns
+        return True
+
+    def _read_presets_conf_if_exists(self) -> bool:
+        """Load the config into a fresh parser without modifying the filesystem.
+
+        Returns False if the config file does not exist.
+        """
+        self._create_config_parser()
+        if self._config_known_absent():
+            return False
+        try:
+            f = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            if self._confirm_config_absent():
+                return False
+            try:
+                f = self.path.open("r", encoding="utf-8")
+            except FileNotFoundError:
+                return False
+        with f:
+            self.config_parser.read_file(f)
+        return True
+
     def _add_section_if_not_exists(
         self,
         section: str
@@ -105,6 +166,7 @@ class MangoHudConfigEditor:
             self.config_parser.set(section, fl, None)
 
     def _write_presets_conf(self) -> None:
+        self._absent_parent_mtime_ns = _NOT_CACHED
         with self.path.open("w", encoding="utf-8") as f:
             self.config_parser.write(f)
 
@@ -171,9 +233,8 @@ class MangoHudConfigEditor:
         preset: int = 3,
     ) -> dict[str, str | None]:
         """Get the current key-value pairs and flags of a MangoHud preset."""
-        self._create_presets_conf_dirs_parents()
-        self._create_presets_conf_if_doesnt_exist()
-        self._read_with_config_parser()
+        if not self._read_presets_conf_if_exists():
+            return {}
 
         preset_header = f"preset {preset}"
         if not self.config_parser.has_section(preset_header):
@@ -190,9 +251,8 @@ class MangoHudConfigEditor:
         preset: int = 3,
     ) -> bool:
         """Check if a MangoHud preset is empty (has no keys or flags)."""
-        self._create_presets_conf_dirs_parents()
-        self._create_presets_conf_if_doesnt_exist()
-        self._read_with_config_parser()
+        if not self._read_presets_conf_if_exists():
+            return True
 
         preset_header = f"preset {preset}"
         if not self.config_parser.has_section(preset_header):
@@ -206,9 +266,8 @@ class MangoHudConfigEditor:
         preset: int = 3,
     ) -> bool:
         """Check if a MangoHud preset contains only the plugin's default keys and flags."""
-        self._create_presets_conf_dirs_parents()
-        self._create_presets_conf_if_doesnt_exist()
-        self._read_with_config_parser()
+        if not self._read_presets_conf_if_exists():
+            return False
 
         preset_header = f"preset {preset}"
         if not self.config_parser.has_section(preset_header):
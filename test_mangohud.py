@@ -2,18 +2,29 @@ import unittest
 import tempfile
 from pathlib import Path
 from configparser import ConfigParser
+import asyncio
+import io
+import os
 
 # Mock the decky plugin, I don't need to test it
 import sys
 from unittest import mock
 sys.modules['decky'] = mock.MagicMock()
 
+import main
 from main import (
     MangoHudConfigEditor,
     MANGOHUD_DEFAULT_PRESET_NUMBER,
     MANGOHUD_DEFAULT_PRESET_KEY_VALUES,
     MANGOHUD_DEFAULT_PRESET_FLAGS,
 )
+from _decky_load_harness import (
+    Stats,
+    _percentile,
+    create_fake_decky,
+    format_report,
+    run_load_test,
+)
 
 
 class TestMangoHudConfigEditorDefault(unittest.TestCase):
@@ -370,5 +381,191 @@ class TestMangoHudConfigEditorDefault(unittest.TestCase):
         only_plugin_data = self.editor.preset_data_is_only_plugin_data(preset=preset_number)
         self.assertTrue(only_plugin_data)
 
+
+_FS_CALLS = {os.stat, os.lstat, os.mkdir, os.open, os.utime, io.open}
+
+# Filesystem calls per query before the query path became read-only, which ran
+# mkdir(parents, exist_ok) + exists() (a stat) + touch() when missing + open().
+# touch() is counted as its os.open only, ignoring its failed utime attempt.
+_LEGACY_QUERY_CALLS_CONFIG_EXISTS = 3  # mkdir, stat, io.open
+_LEGACY_QUERY_CALLS_CONFIG_MISSING = 4  # mkdir, stat, os.open, io.open
+
+
+def _count_fs_calls(fn, *args, **kwargs) -> int:
+    """Count calls to the filesystem entry points in _FS_CALLS made by fn."""
+    count = 0
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event == "c_call" and arg in _FS_CALLS:
+            count += 1
+
+    prev = sys.getprofile()
+    sys.setprofile(profile)
+    try:
+        fn(*args, **kwargs)
+    finally:
+        sys.setprofile(prev)
+    return count
+
+
+class TestMangoHudConfigEditorReadOnlyQueries(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = Path(self.temp_dir) / "MangoHud"
+        self.test_config_path = self.config_dir / "presets.conf"
+        self.editor = MangoHudConfigEditor(path=self.test_config_path)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _age_config_dir(self):
+        """Backdate the config dir so its mtime is outside the racy window."""
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        old = os.stat(self.config_dir).st_mtime - 60
+        os.utime(self.config_dir, (old, old))
+
+    def test_queries_do_not_create_files_or_dirs(self):
+        """Test that read-only queries never touch the filesystem."""
+        self.assertEqual(self.editor.get_current_preset_data(preset=3), {})
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+        self.assertFalse(self.editor.preset_data_is_only_plugin_data(preset=3))
+
+        self.assertFalse(self.config_dir.exists())
+        self._age_config_dir()
+        self.editor.preset_data_is_empty(preset=3)
+        self.assertFalse(self.test_config_path.exists())
+
+    def test_query_syscalls_on_missing_config(self):
+        """Test that a cached missing config costs a single stat per query."""
+        self._age_config_dir()
+        self.editor.preset_data_is_empty(preset=3)  # warm the negative cache
+
+        after = _count_fs_calls(self.editor.preset_data_is_empty, preset=3)
+
+        self.assertEqual(after, 1)
+        self.assertLess(after, _LEGACY_QUERY_CALLS_CONFIG_MISSING)
+
+    def test_query_syscalls_on_existing_config(self):
+        """Test that querying an existing config only opens it."""
+        self.editor.upsert_mangohud_preset(preset=3)
+
+        after = _count_fs_calls(self.editor.get_current_preset_data, preset=3)
+
+        self.assertEqual(after, 1)
+        self.assertLess(after, _LEGACY_QUERY_CALLS_CONFIG_EXISTS)
+
+    def test_missing_config_cache_sees_file_appear(self):
+        """Test that the cached "file absent" is dropped once the file is created externally."""
+        self._age_config_dir()
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+
+        self.test_config_path.write_text("[preset 3]\nfps\n", encoding="utf-8")
+
+        self.assertFalse(self.editor.preset_data_is_empty(preset=3))
+        self.assertEqual(self.editor.get_current_preset_data(preset=3), {"fps": None})
+
+    def test_missing_config_cache_sees_symlink_target_appear(self):
+        """Test that a dangling symlink config is not cached as absent."""
+        target_dir = Path(self.temp_dir) / "dotfiles"
+        target_dir.mkdir()
+        target = target_dir / "presets.conf"
+        self._age_config_dir()
+        self.test_config_path.symlink_to(target)
+        self._age_config_dir()
+
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+
+        target.write_text("[preset 3]\nfps\n", encoding="utf-8")
+
+        self.assertFalse(self.editor.preset_data_is_empty(preset=3))
+
+    def test_query_on_config_deleted_during_read(self):
+        """Test that a config vanishing between the existence re-check and open reads as absent."""
+        with mock.patch.object(self.editor, "_confirm_config_absent", return_value=False):
+            self.assertEqual(self.editor.get_current_preset_data(preset=3), {})
+        self.assertIs(self.editor._absent_parent_mtime_ns, main._NOT_CACHED)
+
+    def test_missing_config_cache_sees_own_writes(self):
+        """Test that writes through the editor invalidate the cached "file absent"."""
+        self._age_config_dir()
+        self.assertTrue(self.editor.preset_data_is_empty(preset=3))
+
+        self.editor.upsert_mangohud_preset(preset=3)
+
+        self.assertFalse(self.editor.preset_data_is_empty(preset=3))
+
+
+class TestDeckyLoadHarness(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_config_path = Path(self.temp_dir) / "MangoHud" / "presets.conf"
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_run_load_test_drives_plugin_methods(self):
+        """Test that the load harness exercises the Plugin RPCs without errors."""
+        fake_decky = create_fake_decky(Path(self.temp_dir))
+        editor = MangoHudConfigEditor(path=self.test_config_path)
+        with mock.patch.object(main, "decky", fake_decky), \
+                mock.patch.object(main, "mangohud_editor", editor):
+            stats, elapsed = asyncio.run(
+                run_load_test(main.Plugin(), clients=4, duration=0.2)
+            )
+
+        self.assertGreater(elapsed, 0)
+        if stats.errors:
+            import traceback
+            self.fail("".join(
+                f"{method}:\n" + "".join(traceback.format_exception(exc))
+                for method, exc in stats.first_exceptions.items()
+            ))
+        self.assertIn("mangohud_upsert_time_preset", stats.latencies)
+        self.assertIn("mangohud_get_current_preset_data", stats.latencies)
+        self.assertTrue(stats.loop_lag)
+        self.assertTrue(self.test_config_path.exists())
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles on a known distribution."""
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(_percentile(values, 50), 50.0)
+        self.assertEqual(_percentile(values, 99), 99.0)
+        self.assertEqual(_percentile(values, 100), 100.0)
+        self.assertEqual(_percentile(values, 0), 1.0)
+        self.assertEqual(_percentile([], 99), 0.0)
+
+    def test_format_report(self):
+        """Test that the report has a header, one row per method and the loop-lag line."""
+        stats = Stats()
+        for ms in range(1, 101):
+            stats.record("mangohud_get_current_preset_data", ms / 1000)
+        stats.record("mangohud_delete_preset", 0.002)
+        first = RuntimeError("boom")
+        with self.assertLogs("decky-loadtest", level="ERROR"):
+            stats.record_error("mangohud_delete_preset", first)
+        stats.record_error("mangohud_delete_preset", RuntimeError("again"))
+        stats.loop_lag.extend([0.001, 0.004])
+
+        self.assertIs(stats.first_exceptions["mangohud_delete_preset"], first)
+        lines = format_report(stats, elapsed=2.0).splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].startswith("method"))
+        delete_row = lines[1].split()
+        self.assertEqual(delete_row[:4], ["mangohud_delete_preset", "1", "2", "0.5"])
+        get_row = lines[2].split()
+        self.assertEqual(get_row, [
+            "mangohud_get_current_preset_data", "100", "0", "50.0",
+            "50.000", "95.000", "99.000", "100.000",
+        ])
+        self.assertEqual(
+            lines[3], "event-loop lag: samples=2 p50=1.000ms p99=4.000ms max=4.000ms"
+        )
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file